@@ -0,0 +1,40 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+from nslsii.iocs.utils import wait_for_pv
+
+
+@pytest.fixture(scope='session')
+def eps_two_state_ioc():
+    '''Runs the EPS two-state simulated IOC once for the whole test session.
+
+    Yields the PV prefix of the IOC.
+    '''
+
+    # the IOC output is never read, so discard it rather than let it fill a
+    # pipe buffer and block the IOC.
+    ioc_process = subprocess.Popen([sys.executable, '-m',
+                                    'caproto.tests.example_runner',
+                                    'nslsii.iocs.eps_two_state_ioc_sim'],
+                                   stdout=subprocess.DEVNULL,
+                                   env=os.environ)
+
+    print('nslsii.iocs.epc_two_state_ioc_sim is now running')
+
+    # Wrap the rest in a try-except to ensure the ioc is killed before exiting
+    try:
+        wait_for_pv('eps2state:Enbl-Sts', ioc_process)
+        yield 'eps2state:'
+    finally:
+        # Ensure that the ioc sub-process is terminated at the end of the
+        # session, whatever the outcome of the tests, and reaped so that it
+        # does not linger as a zombie.
+        ioc_process.terminate()
+        try:
+            ioc_process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            ioc_process.kill()
+            ioc_process.wait()
@@ -1,8 +1,3 @@
-import os
-import subprocess
-import sys
-import time
-
 from ophyd import Device, EpicsSignal, EpicsSignalRO
 from ophyd.device import (Component as Cpt,
                           FormattedComponent as FmtCpt)
@@ -38,170 +33,149 @@ class EPSTwoStateDevice(Device):
                         kind='omitted')
 
 
-def test_epstwostate_ioc():
-
-    stdout = subprocess.PIPE
-    stdin = None
-
-    ioc_process = subprocess.Popen([sys.executable, '-m',
-                                    'caproto.tests.example_runner',
-                                    'nslsii.iocs.eps_two_state_ioc_sim'],
-                                   stdout=stdout, stdin=stdin,
-                                   env=os.environ)
-
-    print('nslsii.iocs.epc_two_state_ioc_sim is now running')
-
-    time.sleep(5)
-
-    # Wrap the rest in a try-except to ensure the ioc is killed before exiting
-    try:
-
-        eps = EPSTwoStateDevice(prefix='eps2state:', name='eps')
+def test_epstwostate_ioc(eps_two_state_ioc):
 
-        # 1. check the ioc-device connection and initial values
-        sts_val = eps.status.get()
-        assert sts_val == 'Open'
+    eps = EPSTwoStateDevice(prefix=eps_two_state_ioc, name='eps')
 
-        opn_cmd_val = eps.opn_cmd.get()
-        assert opn_cmd_val == 'None'
+    # 1. check the ioc-device connection and initial values
+    sts_val = eps.status.get()
+    assert sts_val == 'Open'
 
-        cls_cmd_val = eps.cls_cmd.get()
-        assert cls_cmd_val == 'None'
+    opn_cmd_val = eps.opn_cmd.get()
+    assert opn_cmd_val == 'None'
 
-        fail_to_opn_val = eps.fail_to_opn.get()
-        assert fail_to_opn_val == 'False'
+    cls_cmd_val = eps.cls_cmd.get()
+    assert cls_cmd_val == 'None'
 
-        fail_to_cls_val = eps.fail_to_cls.get()
-        assert fail_to_cls_val == 'False'
+    fail_to_opn_val = eps.fail_to_opn.get()
+    assert fail_to_opn_val == 'False'
 
-        enbl_sts_val = eps.enbl_sts.get()
-        assert enbl_sts_val == 'True'
+    fail_to_cls_val = eps.fail_to_cls.get()
+    assert fail_to_cls_val == 'False'
 
-        hw_error_val = eps.hw_error_sts.get()
-        assert hw_error_val == 'False'
+    enbl_sts_val = eps.enbl_sts.get()
+    assert enbl_sts_val == 'True'
 
-        sts_error_val = eps.sts_error_sts.get()
-        assert sts_error_val == 'False'
+    hw_error_val = eps.hw_error_sts.get()
+    assert hw_error_val == 'False'
 
-        # 2. try to close with one attempt
+    sts_error_val = eps.sts_error_sts.get()
+    assert sts_error_val == 'False'
 
-        eps.cls_cmd.put(1)
+    # 2. try to close with one attempt
 
-        cls_cmd_val = eps.cls_cmd.get()
-        assert cls_cmd_val == 'None'
+    eps.cls_cmd.put(1)
 
-        fail_to_cls_val = eps.fail_to_cls.get()
-        assert fail_to_cls_val == 'False'
+    cls_cmd_val = eps.cls_cmd.get()
+    assert cls_cmd_val == 'None'
 
-        sts_val = eps.status.get()
-        assert sts_val == 'Open'
+    fail_to_cls_val = eps.fail_to_cls.get()
+    assert fail_to_cls_val == 'False'
 
-        # 3. try to close with second attempt
+    sts_val = eps.status.get()
+    assert sts_val == 'Open'
 
-        eps.cls_cmd.put(1)
+    # 3. try to close with second attempt
 
-        cls_cmd_val = eps.cls_cmd.get()
-        assert cls_cmd_val == 'None'
+    eps.cls_cmd.put(1)
 
-        fail_to_cls_val = eps.fail_to_cls.get()
-        assert fail_to_cls_val == 'False'
+    cls_cmd_val = eps.cls_cmd.get()
+    assert cls_cmd_val == 'None'
 
-        sts_val = eps.status.get()
-        assert sts_val == 'Closed'
+    fail_to_cls_val = eps.fail_to_cls.get()
+    assert fail_to_cls_val == 'False'
 
-        # 4. try to open with one attempt
+    sts_val = eps.status.get()
+    assert sts_val == 'Closed'
 
-        eps.opn_cmd.put(1)
+    # 4. try to open with one attempt
 
-        opn_cmd_val = eps.opn_cmd.get()
-        assert opn_cmd_val == 'None'
+    eps.opn_cmd.put(1)
 
-        fail_to_opn_val = eps.fail_to_opn.get()
-        assert fail_to_opn_val == 'False'
+    opn_cmd_val = eps.opn_cmd.get()
+    assert opn_cmd_val == 'None'
 
-        sts_val = eps.status.get()
-        assert sts_val == 'Closed'
+    fail_to_opn_val = eps.fail_to_opn.get()
+    assert fail_to_opn_val == 'False'
 
-        # 5. try to open with second attempt
+    sts_val = eps.status.get()
+    assert sts_val == 'Closed'
 
-        eps.opn_cmd.put(1)
+    # 5. try to open with second attempt
 
-        opn_cmd_val = eps.opn_cmd.get()
-        assert opn_cmd_val == 'None'
+    eps.opn_cmd.put(1)
 
-        fail_to_opn_val = eps.fail_to_opn.get()
-        assert fail_to_opn_val == 'False'
+    opn_cmd_val = eps.opn_cmd.get()
+    assert opn_cmd_val == 'None'
 
-        sts_val = eps.status.get()
-        assert sts_val == 'Open'
+    fail_to_opn_val = eps.fail_to_opn.get()
+    assert fail_to_opn_val == 'False'
 
-        # 6. disable changes and try to close
+    sts_val = eps.status.get()
+    assert sts_val == 'Open'
 
-        eps.enbl_sts.put(0)
+    # 6. disable changes and try to close
 
-        eps.cls_cmd.put(1)
-        eps.cls_cmd.put(1)
+    eps.enbl_sts.put(0)
 
-        cls_cmd_val = eps.cls_cmd.get()
-        assert cls_cmd_val == 'None'
+    eps.cls_cmd.put(1)
+    eps.cls_cmd.put(1)
 
-        fail_to_cls_val = eps.fail_to_cls.get()
-        assert fail_to_cls_val == 'True'
+    cls_cmd_val = eps.cls_cmd.get()
+    assert cls_cmd_val == 'None'
 
-        sts_val = eps.status.get()
-        assert sts_val == 'Open'
+    fail_to_cls_val = eps.fail_to_cls.get()
+    assert fail_to_cls_val == 'True'
 
-        # 7. enable changes, enable the hw error, and try to close
+    sts_val = eps.status.get()
+    assert sts_val == 'Open'
 
-        eps.enbl_sts.put(1)
-        eps.hw_error_sts.put(1)
+    # 7. enable changes, enable the hw error, and try to close
 
-        eps.cls_cmd.put(1)
-        eps.cls_cmd.put(1)
+    eps.enbl_sts.put(1)
+    eps.hw_error_sts.put(1)
 
-        cls_cmd_val = eps.cls_cmd.get()
-        assert cls_cmd_val == 'Done'
+    eps.cls_cmd.put(1)
+    eps.cls_cmd.put(1)
 
-        fail_to_cls_val = eps.fail_to_cls.get()
-        assert fail_to_cls_val == 'True'
+    cls_cmd_val = eps.cls_cmd.get()
+    assert cls_cmd_val == 'Done'
 
-        sts_val = eps.status.get()
-        assert sts_val == 'Open'
+    fail_to_cls_val = eps.fail_to_cls.get()
+    assert fail_to_cls_val == 'True'
 
-        # 8. disable the hw error, enable the sts error, and try to close
+    sts_val = eps.status.get()
+    assert sts_val == 'Open'
 
-        eps.hw_error_sts.put(0)
-        eps.sts_error_sts.put(1)
+    # 8. disable the hw error, enable the sts error, and try to close
 
-        eps.cls_cmd.put(1)
-        eps.cls_cmd.put(1)
+    eps.hw_error_sts.put(0)
+    eps.sts_error_sts.put(1)
 
-        cls_cmd_val = eps.cls_cmd.get()
-        assert cls_cmd_val == 'Done'
+    eps.cls_cmd.put(1)
+    eps.cls_cmd.put(1)
 
-        fail_to_cls_val = eps.fail_to_cls.get()
-        assert fail_to_cls_val == 'False'
+    cls_cmd_val = eps.cls_cmd.get()
+    assert cls_cmd_val == 'Done'
 
-        sts_val = eps.status.get()
-        assert sts_val == 'Open'
+    fail_to_cls_val = eps.fail_to_cls.get()
+    assert fail_to_cls_val == 'False'
 
-        # 9. disable the sts error and try to close
+    sts_val = eps.status.get()
+    assert sts_val == 'Open'
 
-        eps.sts_error_sts.put(0)
+    # 9. disable the sts error and try to close
 
-        eps.cls_cmd.put(1)
-        eps.cls_cmd.put(1)
+    eps.sts_error_sts.put(0)
 
-        cls_cmd_val = eps.cls_cmd.get()
-        assert cls_cmd_val == 'None'
+    eps.cls_cmd.put(1)
+    eps.cls_cmd.put(1)
 
-        fail_to_cls_val = eps.fail_to_cls.get()
-        assert fail_to_cls_val == 'False'
+    cls_cmd_val = eps.cls_cmd.get()
+    assert cls_cmd_val == 'None'
 
-        sts_val = eps.status.get()
-        assert sts_val == 'Closed'
+    fail_to_cls_val = eps.fail_to_cls.get()
+    assert fail_to_cls_val == 'False'
 
-    finally:
-        # Ensure that for any exception the ioc sub-process is terminated
-        # before raising.
-        ioc_process.terminate()
+    sts_val = eps.status.get()
+    assert sts_val == 'Closed'
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
 import datetime
+import time
 from pathlib import Path
 
 import h5py
 import numpy as np
+from caproto import CaprotoTimeoutError
+from caproto.sync.client import read
 
 
 def now(as_object=False):
@@ -15,6 +18,29 @@ def now(as_object=False):
     return _now.isoformat()
 
 
+def wait_for_pv(pv_name, process=None, timeout=10, poll_interval=0.05):
+    """Poll `pv_name` until it can be read, as a sign that its IOC is up.
+
+    If `process`, the IOC's subprocess.Popen, is given, a RuntimeError is
+    raised as soon as it exits. A caproto.CaprotoTimeoutError is raised if
+    the PV cannot be read within `timeout` seconds.
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            read(pv_name, timeout=poll_interval)
+        except CaprotoTimeoutError:
+            if process is not None and process.poll() is not None:
+                raise RuntimeError(
+                    f"IOC serving {pv_name} exited with status {process.returncode}"
+                ) from None
+            if time.monotonic() > deadline:
+                raise
+            time.sleep(poll_interval)
+        else:
+            return
+
+
 def save_image(fname, data, file_format="jpeg", mode="x"):  # pylint: disable=unused-argument
     """The function to export the image data (e.g., to a JPEG file."""
     data.save(fname, file_format=file_format)
@@ -1,60 +1,176 @@
 import argparse
+import atexit
+import functools
+import importlib.util
 import json
 import os
 import re
+import threading
+import time
 import warnings
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 from getpass import getpass
+from types import MappingProxyType
 from typing import Any, Dict, Union, Optional
 
 import httpx
+import orjson
 import redis
 import yaml
-from ldap3 import NTLM, Connection, Server
+from ldap3 import NONE, NTLM, Connection, Server
 from ldap3.core.exceptions import LDAPInvalidCredentialsResult, LDAPSocketOpenError
 from redis_json_dict import RedisJSONDict
 
-data_session_re = re.compile(r"^pass-(?P<proposal_number>\d+)$")
+data_session_re = re.compile(r"^pass-(?P<proposal_number>\d+)\Z")
 
-nslsii_api_client = httpx.Client(base_url="https://api.nsls2.bnl.gov")
+# endstations that share a single beamline Redis server
+normalized_beamlines = MappingProxyType(
+    {
+        "sst1": "sst",
+        "sst2": "sst",
+    }
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _api_client() -> httpx.Client:
+    """Return the shared NSLS-II API client, creating it on first use."""
+    client = httpx.Client(
+        base_url="https://api.nsls2.bnl.gov",
+        # HTTP/2 needs the optional h2 package; fall back to HTTP/1.1 without it
+        http2=importlib.util.find_spec("h2") is not None,
+        timeout=httpx.Timeout(10.0, connect=5.0),
+        limits=httpx.Limits(max_keepalive_connections=8, keepalive_expiry=60),
+    )
+    atexit.register(client.close)
+    return client
+
+
+def __getattr__(name):
+    # nslsii_api_client used to be created at import time
+    if name == "nslsii_api_client":
+        return _api_client()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _json(response):
+    """Decode an httpx response body with orjson."""
+    return orjson.loads(response.content)
+
+
+@functools.lru_cache(maxsize=16)
+def _redis_client(host, port=6379, db=0):
+    """Return a Redis client for (host, port, db), reusing its connection pool across calls."""
+    return redis.Redis(
+        host=host, port=port, db=db, socket_keepalive=True, health_check_interval=30
+    )
+
+
+def _ttl_cache(ttl, maxsize=128):
+    """Memoize a function by its positional arguments for `ttl` seconds.
+
+    At most `maxsize` results are kept; expired results are dropped when they
+    are looked up, and the least recently used result when the cache is full.
+    The wrapped function gains a `cache_clear()` method.
+    """
 
+    def decorator(func):
+        cache = {}
+        lock = threading.Lock()
 
+        @functools.wraps(func)
+        def wrapper(*args):
+            now = time.monotonic()
+            with lock:
+                value, expires_at = cache.pop(args, (None, now))
+                if now < expires_at:
+                    # re-inserted so that dict order is least recently used first
+                    cache[args] = (value, expires_at)
+                    return value
+            value = func(*args)
+            with lock:
+                cache[args] = (value, now + ttl)
+                while len(cache) > maxsize:
+                    del cache[next(iter(cache))]
+            return value
+
+        wrapper.cache_clear = cache.clear
+        return wrapper
+
+    return decorator
+
+
+# the facility cycle and commissioning proposals change on a scale of
+# hours to months, so they are re-fetched at most this often (in seconds)
+API_CACHE_TTL = 300
+
+
+@_ttl_cache(API_CACHE_TTL)
 def get_current_cycle() -> str:
-    cycle_response = nslsii_api_client.get(
+    cycle_response = _api_client().get(
         f"/v1/facility/nsls2/cycles/current"
     ).raise_for_status()
-    return cycle_response.json()["cycle"]
+    return _json(cycle_response)["cycle"]
 
 
-def is_commissioning_proposal(proposal_number, beamline) -> bool:
-    """True if proposal_number is registered as a commissioning proposal; else False."""
-    commissioning_proposals_response = nslsii_api_client.get(
+@_ttl_cache(API_CACHE_TTL)
+def get_commissioning_proposals(beamline):
+    """Return the set of commissioning proposal numbers for beamline."""
+    commissioning_proposals_response = _api_client().get(
         f"/v1/proposals/commissioning?beamline={beamline}"
     ).raise_for_status()
-    commissioning_proposals = commissioning_proposals_response.json()[
-        "commissioning_proposals"
-    ]
-    return proposal_number in commissioning_proposals
+    return frozenset(
+        _json(commissioning_proposals_response)["commissioning_proposals"]
+    )
+
+
+def clear_cycle_cache():
+    """Forget cached cycle and commissioning-proposal responses."""
+    get_current_cycle.cache_clear()
+    get_commissioning_proposals.cache_clear()
+
+
+def is_commissioning_proposal(proposal_number, beamline) -> bool:
+    """True if proposal_number is registered as a commissioning proposal; else False."""
+    return proposal_number in get_commissioning_proposals(beamline)
 
 
 def validate_proposal(data_session_value, beamline) -> Dict[str, Any]:
     proposal_data = {}
-    data_session_match = data_session_re.match(data_session_value)
-
-    if data_session_match is None:
+    # equivalent to data_session_re.fullmatch(), without the regex engine
+    proposal_number = data_session_value[len("pass-"):]
+    if not (data_session_value.startswith("pass-") and proposal_number.isdecimal()):
         raise ValueError(
             f"RE.md['data_session']='{data_session_value}' "
             f"is not matched by regular expression '{data_session_re.pattern}'"
         )
 
     try:
-        current_cycle = get_current_cycle()
-        proposal_number = data_session_match.group("proposal_number")
-        proposal_commissioning = is_commissioning_proposal(proposal_number, beamline)
-        proposal_response = nslsii_api_client.get(
-            f"/v1/proposal/{proposal_number}"
-        ).raise_for_status()
-        proposal_data = proposal_response.json()["proposal"]
+        # create the shared client here, not in the worker threads, so that
+        # all three requests use the same client and its HTTP/2 connection
+        client = _api_client()
+        # the three requests are independent, so issue them concurrently
+        executor = ThreadPoolExecutor(max_workers=3)
+        try:
+            current_cycle_future = executor.submit(get_current_cycle)
+            proposal_commissioning_future = executor.submit(
+                is_commissioning_proposal, proposal_number, beamline
+            )
+            proposal_response_future = executor.submit(
+                client.get, f"/v1/proposal/{proposal_number}"
+            )
+        finally:
+            # do not wait for requests whose results turn out to be unneeded
+            executor.shutdown(wait=False)
+
+        proposal_commissioning = proposal_commissioning_future.result()
+        # the current cycle is not checked for commissioning proposals
+        current_cycle = (
+            None if proposal_commissioning else current_cycle_future.result()
+        )
+        proposal_response = proposal_response_future.result().raise_for_status()
+        proposal_data = _json(proposal_response)["proposal"]
         if "error_message" in proposal_data:
             raise ValueError(
                 f"while verifying data_session '{data_session_value}' "
@@ -86,20 +202,25 @@ def validate_proposal(data_session_value, beamline) -> Dict[str, Any]:
     return proposal_data
 
 
+try:
+    from yaml import CSafeLoader as _YAMLLoader
+except ImportError:
+    from yaml import SafeLoader as _YAMLLoader
+
 config_files = [
     os.path.expanduser("~/.config/n2sn_tools.yml"),
     "/etc/n2sn_tools.yml",
 ]
 
 
-def authenticate(
-    username,
-):
+@functools.lru_cache(maxsize=1)
+def _load_config():
+    """Return the parsed contents of the first readable file in config_files."""
     config = None
     for fn in config_files:
         try:
             with open(fn) as f:
-                config = yaml.safe_load(f)
+                config = yaml.load(f, Loader=_YAMLLoader)
         except IOError:
             pass
         else:
@@ -108,12 +229,26 @@ def authenticate(
     if config is None:
         raise RuntimeError("Unable to open a config file")
 
+    return config
+
+
+@functools.lru_cache(maxsize=4)
+def _auth_server(server):
+    # only who_am_i() is used, so skip reading the server schema and DSE info
+    return Server(server, use_ssl=True, get_info=NONE, connect_timeout=5)
+
+
+def authenticate(
+    username,
+):
+    config = _load_config()
+
     server = config.get("common", {}).get("server")
 
     if server is None:
         raise RuntimeError(f"Server name not found!")
 
-    auth_server = Server(server, use_ssl=True)
+    auth_server = _auth_server(server)
 
     try:
         connection = Connection(
@@ -132,19 +267,27 @@ def authenticate(
         print(f"{server} server connection failed...")
 
 
-def should_they_be_here(username, new_data_session, beamline):
-    user_access_json = nslsii_api_client.get(f"/v1/data-session/{username}").json()
-
-    if "nsls2" in user_access_json["facility_all_access"]:
-        return True
+@_ttl_cache(60, maxsize=256)
+def _get_user_access(username):
+    """Return (facility_all_access, beamline_all_access, data_sessions) as frozensets."""
+    user_access_json = _json(_api_client().get(f"/v1/data-session/{username}"))
+    return (
+        frozenset(user_access_json["facility_all_access"]),
+        frozenset(user_access_json["beamline_all_access"]),
+        frozenset(user_access_json["data_sessions"]),
+    )
 
-    elif beamline.lower() in user_access_json["beamline_all_access"]:
-        return True
 
-    elif new_data_session in user_access_json["data_sessions"]:
-        return True
+def should_they_be_here(username, new_data_session, beamline):
+    facility_all_access, beamline_all_access, data_sessions = _get_user_access(
+        username
+    )
 
-    return False
+    return (
+        "nsls2" in facility_all_access
+        or beamline.lower() in beamline_all_access
+        or new_data_session in data_sessions
+    )
 
 
 class AuthorizationError(Exception): ...
@@ -175,7 +318,7 @@ def switch_redis_proposal(
         The updated redis dictionary.
     """
 
-    redis_client = redis.Redis(host=f"info.{beamline.lower()}.nsls2.bnl.gov")
+    redis_client = _redis_client(f"info.{beamline.lower()}.nsls2.bnl.gov")
     redis_prefix = f"{prefix}-" if prefix else ""
     md = RedisJSONDict(redis_client=redis_client, prefix=redis_prefix)
     username = username or md.get("username")
@@ -197,29 +340,32 @@ def switch_redis_proposal(
 
         proposal_data = validate_proposal(new_data_session, beamline)
         users = proposal_data.pop("users")
-        pi_name = ""
-        for user in users:
-            if user.get("is_pi"):
-                pi_name = (
-                    f'{user.get("first_name", "")} {user.get("last_name", "")}'.strip()
-                )
-
-        md["data_session"] = new_data_session
-        md["username"] = username
-        md["start_datetime"] = datetime.now().isoformat()
-        md["cycle"] = (
-            "commissioning"
-            if is_commissioning_proposal(str(proposal_number), beamline)
-            else get_current_cycle()
+        pi = next((user for user in users if user.get("is_pi")), {})
+        pi_name = f'{pi.get("first_name", "")} {pi.get("last_name", "")}'.strip()
+
+        # RedisJSONDict.update() sends all keys in a single pipeline
+        md.update(
+            {
+                "data_session": new_data_session,
+                "username": username,
+                "start_datetime": datetime.now(timezone.utc).isoformat(
+                    timespec="seconds"
+                ),
+                "cycle": (
+                    "commissioning"
+                    if is_commissioning_proposal(str(proposal_number), beamline)
+                    else get_current_cycle()
+                ),
+                "proposal": {
+                    "proposal_id": proposal_data.get("proposal_id"),
+                    "title": proposal_data.get("title"),
+                    "type": proposal_data.get("type"),
+                    "pi_name": pi_name,
+                },
+            }
         )
-        md["proposal"] = {
-            "proposal_id": proposal_data.get("proposal_id"),
-            "title": proposal_data.get("title"),
-            "type": proposal_data.get("type"),
-            "pi_name": pi_name,
-        }
 
-        print(f"Started experiment {md['data_session']} by {md['username']}.")
+        print(f"Started experiment {new_data_session} by {username}.")
 
     return md
 
@@ -230,10 +376,6 @@ def sync_experiment(proposal_number, beamline, verbose=False, prefix=""):
     username = input("Username : ")
     authenticate(username)
 
-    normalized_beamlines = {
-        "sst1": "sst",
-        "sst2": "sst",
-    }
     redis_beamline = normalized_beamlines.get(beamline.lower(), beamline)
 
     md = switch_redis_proposal(
@@ -24,9 +24,8 @@ class Eurotherm(Device):
         super().__init__(pv_prefix, **kwargs)
         self._set_lock = threading.Lock()
 
-        # defining these here so that they can be used by `set` and `start`
-        self._cb_timer = None
-        self._cid = None
+        # defining this here so that it can be used by `set` and `stop`
+        self._finish_set = None
 
     # Setup some new signals required for the moving indicator logic
     equilibrium_time = Cpt(Signal, value=5, kind='config')
@@ -48,59 +47,90 @@ class Eurotherm(Device):
         set_value = value
         status = DeviceStatus(self)
 
-        initial_timestamp = None
-
         # grab these values here to avoidmutliple calls.
         equilibrium_time = self.equilibrium_time.get()
         tolerance = self.tolerance.get()
+        timeout = self.timeout.get()
+
+        # the state of this set is shared by the CA callback thread and the two
+        # timer threads, so it is only changed while holding `state_lock`.
+        # `episode` counts the times the readback left the tolerance band, so
+        # that an equilibrium timer that was cancelled after it had already
+        # fired cannot finish the set.
+        state_lock = threading.Lock()
+        done = False
+        episode = 0
+        eq_timer = None
+
+        # finish the set exactly once, whichever of the equilibrium timer, the
+        # timeout timer or `stop` gets here first, returning True only for
+        # that first call.
+        def finish(success=True, from_episode=None):
+            nonlocal done, eq_timer
+            with state_lock:
+                if done or (from_episode is not None and
+                            from_episode != episode):
+                    return False
+                done = True
+                if eq_timer is not None:
+                    eq_timer.cancel()
+                    eq_timer = None
+            cb_timer.cancel()
+            self.readback.clear_sub(status_indicator)
+            self._set_lock.release()
+            status._finished(success=success)
+            return True
 
         # setup a cleanup function for the timer, this matches including
         # timeout in `status` but also ensures that the callback is removed.
         def timer_cleanup():
-            print('Set of {} timed out after {} s'.format(self.name,
-                                                          self.timeout.get()))
-            self._set_lock.release()
-            self.readback.clear_sub(status_indicator)
-            status._finished(success=False)
-
-        self._cb_timer = threading.Timer(self.timeout.get(), timer_cleanup)
-
-        # set up the done moving indicator logic
-        def status_indicator(value, timestamp, **kwargs):
-            # add a Timer to ensure that timeout occurs.
-            if not self._cb_timer.is_alive():
-                self._cb_timer.start()
-
-            nonlocal initial_timestamp
-            if abs(value - set_value) < tolerance:
-                if initial_timestamp:
-                    if (timestamp - initial_timestamp) > equilibrium_time:
-                        status._finished()
-                        self._cb_timer.cancel()
-                        self._set_lock.release()
-                        self.readback.clear_sub(status_indicator)
-                else:
-                    initial_timestamp = timestamp
-            else:
-                initial_timestamp = None
+            print('Set of {} timed out after {} s'.format(self.name, timeout))
+            finish(success=False)
+
+        cb_timer = threading.Timer(timeout, timer_cleanup)
+
+        # set up the done moving indicator logic, a single timer is armed
+        # when the readback enters the tolerance band and cancelled if it
+        # leaves it again.
+        def status_indicator(value, **kwargs):
+            nonlocal episode, eq_timer
+            with state_lock:
+                if done:
+                    return
+                # add a Timer to ensure that timeout occurs.
+                if not cb_timer.is_alive():
+                    cb_timer.start()
+
+                if abs(value - set_value) < tolerance:
+                    if eq_timer is None:
+                        eq_timer = threading.Timer(
+                            equilibrium_time, finish,
+                            kwargs={'from_episode': episode})
+                        eq_timer.start()
+                elif eq_timer is not None:
+                    eq_timer.cancel()
+                    eq_timer = None
+                    episode += 1
+
+        self._finish_set = finish
 
         # Start the move.
         self.setpoint.put(set_value)
 
         # subscribe to the read value to indicate the set is done.
-        self._cid = self.readback.subscribe(status_indicator)
+        self.readback.subscribe(status_indicator)
 
         # hand the status object back to the RE
         return status
 
     def stop(self, success=False):
-        # overide the lock, cancel the timer and remove the subscription on any
-        # in progress sets
-        self._set_lock.release()
-        self._cb_timer.cancel()
-        self.readback.unsubscribe(self._cid)
+        # finish any in progress set, this cancels its timers, removes the
+        # subscription and releases the lock. Failing its status makes ophyd
+        # call `stop` again, and that nested call does the set below.
+        if self._finish_set is not None and self._finish_set(success=False):
+            return
         # set the controller to the current value (best option we came up with)
-        self.set(self.readback.get())
+        self.set(self.readback.get(use_monitor=True))
 
 
 class SetInProgress(RuntimeError):
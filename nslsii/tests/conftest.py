@@ -1,11 +1,10 @@
-from contextlib import contextmanager  # noqa
-
-import redis
-
 import pytest
 
+# the RE, hw, and Kafka fixtures are imported by name rather than registered
+# with pytest_plugins, which pytest only honours in the rootdir conftest.py;
+# that file is not packaged, so `pytest --pyargs nslsii.tests` would not find
+# them, and every other test directory would pay for importing Kafka
 from bluesky.tests.conftest import RE  # noqa
-from bluesky_kafka import BlueskyConsumer  # noqa
 from bluesky_kafka.tests.conftest import (  # noqa
     kafka_bootstrap_servers,
     consume_documents_from_kafka_until_first_stop_document,
@@ -13,8 +12,6 @@ from bluesky_kafka.tests.conftest import (  # noqa
 )
 from ophyd.tests.conftest import hw  # noqa
 
-from nslsii.md_dict import RunEngineRedisDict
-
 
 def pytest_addoption(parser):
     parser.addoption(
@@ -60,22 +57,22 @@ def pytest_addoption(parser):
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def xs3_root_path(request):
     return request.config.getoption("--xs3-root-path")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def xs3_path_template(request):
     return request.config.getoption("--xs3-path-template")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def xs3_pv_prefix(request):
     return request.config.getoption("--xs3-pv-prefix")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def xs3_channel_numbers(request):
     comma_separated_numbers = request.config.getoption("--xs3-channel-numbers")
     if comma_separated_numbers is None:
@@ -85,7 +82,7 @@ def xs3_channel_numbers(request):
         return number_list
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def xs3_mcaroi_numbers(request):
     comma_separated_numbers = request.config.getoption("--xs3-mcaroi-numbers")
     if comma_separated_numbers is None:
@@ -95,8 +92,27 @@ def xs3_mcaroi_numbers(request):
         return number_list
 
 
+REDIS_SERVER_KWARGS = {
+    "host": "localhost",
+    "port": 6379,
+    "db": 0,
+}
+
+
+@pytest.fixture(scope="session")
+def _redis_client():
+    """
+    A single Redis client, and so a single connection pool, for the test session.
+    """
+    # imported here so that collecting tests that do not use Redis
+    # does not pay for importing redis
+    import redis
+
+    return redis.Redis(**REDIS_SERVER_KWARGS)
+
+
 @pytest.fixture
-def redis_dict_factory():
+def redis_dict_factory(_redis_client):
     """
     Return a "fixture as a factory" that will build identical RunEngineRedisDicts.
     Before the factory is returned, the Redis server will be cleared.
@@ -107,25 +123,18 @@ def redis_dict_factory():
     If "host", "port", or "db" are specified as kwargs to the factory function
     an exception will be raised.
     """
-    redis_server_kwargs = {
-        "host": "localhost",
-        "port": 6379,
-        "db": 0,
-    }
+    from nslsii.md_dict import RunEngineRedisDict
 
-    redis_client = redis.Redis(**redis_server_kwargs)
-    redis_client.flushdb()
+    _redis_client.flushdb()
 
     def _factory(**kwargs):
-        disallowed_kwargs_preset = set(redis_server_kwargs.keys()).intersection(
-            kwargs.keys()
-        )
-        if len(disallowed_kwargs_preset) > 0:
+        if not REDIS_SERVER_KWARGS.keys().isdisjoint(kwargs):
+            disallowed_kwargs_preset = REDIS_SERVER_KWARGS.keys() & kwargs.keys()
             raise KeyError(
                 f"{disallowed_kwargs_preset} given, but 'host', 'port', and 'db' may not be specified"
             )
         else:
-            kwargs.update(redis_server_kwargs)
+            kwargs.update(REDIS_SERVER_KWARGS)
 
         return RunEngineRedisDict(**kwargs)
 
@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import date
 from enum import Enum
 import pytest
 import os
@@ -11,9 +11,21 @@ from nslsii.ophyd_async import (
     DeviceNameFilenameProvider,
     YMDGranularity,
 )
+from nslsii.ophyd_async import providers
 from nslsii.ophyd_async.providers import AcqModeFilenameProvider
 
 
+_TODAY = date.today()
+
+
+class _FixedDate(date):
+    """A date whose today() is always _TODAY, so tests do not race midnight."""
+
+    @classmethod
+    def today(cls):
+        return _TODAY
+
+
 class TomoFrameType(Enum):
     proj = "proj"
     flat = "flat"
@@ -45,16 +57,15 @@ def dummy_re_md_dict():
     ],
 )
 def test_proposal_num_ymd_path_provider(
-    ymd_granularity, ymd_separator, dummy_re_md_dict, fp
+    ymd_granularity, ymd_separator, dummy_re_md_dict, fp, monkeypatch
 ):
     os.environ["BEAMLINE_ACRONYM"] = "tst"
+    monkeypatch.setattr(providers, "date", _FixedDate)
 
     pp = ProposalNumYMDPathProvider(
         fp, dummy_re_md_dict, granularity=ymd_granularity, separator=ymd_separator
     )
 
-    today = datetime.today()
-
     info = pp(device_name="test")
     dirpath = str(info.directory_path)
 
@@ -62,22 +73,24 @@ def test_proposal_num_ymd_path_provider(
         "/nsls2/data/tst/proposals/2024-3/pass-000000/assets/test"
     )
 
-    if ymd_granularity == YMDGranularity.none:
-        assert info.create_dir_depth == 0
-        assert dirpath.endswith("test")
-    elif ymd_granularity == YMDGranularity.year:
-        assert info.create_dir_depth == -1
-        assert dirpath.endswith(str(today.year))
-    elif ymd_granularity == YMDGranularity.month:
-        assert info.create_dir_depth == -2
-        assert dirpath.endswith(str(f"{today.year}{ymd_separator}{today.month:02}"))
-    elif ymd_granularity == YMDGranularity.day:
-        assert info.create_dir_depth == -3
-        assert dirpath.endswith(
-            str(
-                f"{today.year}{ymd_separator}{today.month:02}{ymd_separator}{today.day:02}"
-            )
-        )
+    # granularity -> (create_dir_depth, directory path suffix)
+    expected = {
+        YMDGranularity.none: (0, "test"),
+        YMDGranularity.year: (-1, f"{_TODAY.year}"),
+        YMDGranularity.month: (
+            -2,
+            f"{_TODAY.year}{ymd_separator}{_TODAY.month:02}",
+        ),
+        YMDGranularity.day: (
+            -3,
+            f"{_TODAY.year}{ymd_separator}{_TODAY.month:02}"
+            f"{ymd_separator}{_TODAY.day:02}",
+        ),
+    }
+    expected_create_dir_depth, expected_suffix = expected[ymd_granularity]
+
+    assert info.create_dir_depth == expected_create_dir_depth
+    assert dirpath.endswith(expected_suffix)
 
 
 def test_proposal_num_scan_num_path_provider(fp, dummy_re_md_dict):
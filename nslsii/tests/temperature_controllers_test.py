@@ -2,65 +2,169 @@ from nslsii.temperature_controllers import Eurotherm, SetInProgress
 from bluesky.plan_stubs import mv
 from bluesky import RunEngine
 from bluesky.utils import FailedStatus
+from ophyd import Component as Cpt, Signal
+from ophyd.utils import UnknownStatusFailure
 import subprocess
 import os
 import sys
+import time
 import pytest
+from nslsii.iocs.utils import wait_for_pv
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def RE():
-    return RunEngine()
+    RE = RunEngine()
+    yield RE
+    if RE.state not in ('idle', 'panicked'):
+        RE.halt()
 
 
-@pytest.mark.xfail()
-def test_Eurotherm(RE):
-    '''Tests the Eurotherm ophyd device.
+@pytest.fixture(scope='session')
+def thermo_sim_ioc():
+    '''Runs the nslsii.iocs.thermo_sim IOC once for the whole test session.
 
-    Parameters
-    ----------
-    RE : object
-        Bluesky RunEngine for use in testing.
+    Yields the PV prefix of the IOC once its readback PV can be read.
     '''
 
-    stdout = subprocess.PIPE
-    stdin = None
-
-    # Start up an IOC based on the thermo_sim device in caproto.ioc_examples
+    # Start up an IOC based on the thermo_sim device in caproto.ioc_examples;
+    # its output is never read, so discard it rather than let it fill a pipe
+    # buffer and block the IOC.
     ioc_process = subprocess.Popen([sys.executable, '-m',
                                     'caproto.tests.example_runner',
                                     'nslsii.iocs.thermo_sim'],
-                                   stdout=stdout, stdin=stdin,
+                                   stdout=subprocess.DEVNULL,
                                    env=os.environ)
 
     print('caproto.ioc_examples.thermo_sim is now running')
 
     # Wrap the rest in a try-except to ensure the ioc is killed before exiting
     try:
-        euro = Eurotherm('thermo:', name='euro')
-        print('euro object is defined')
+        wait_for_pv('thermo:T-RB', ioc_process)
+        yield 'thermo:'
+
+    finally:
+        # Ensure that for any exception the ioc sub-process is terminated
+        # before raising.
+        ioc_process.terminate()
+        try:
+            ioc_process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            ioc_process.kill()
+            ioc_process.wait()
+
+
+@pytest.mark.xfail()
+def test_Eurotherm(RE, thermo_sim_ioc):
+    '''Tests the Eurotherm ophyd device.
+
+    Parameters
+    ----------
+    RE : object
+        Bluesky RunEngine for use in testing.
+    thermo_sim_ioc : str
+        PV prefix of the thermo_sim IOC.
+    '''
 
-        # move the Eurotherm.
+    euro = Eurotherm(thermo_sim_ioc, name='euro')
+    print('euro object is defined')
+
+    # move the Eurotherm.
+    RE(mv(euro, 100))
+
+    # check that the readback value is within euro.tolerance of 100
+    assert abs(euro.readback.get() - 100) <= euro.tolerance.get()
+    assert len(euro.readback._callbacks['value']) == 0  # ensure cb is gone
+
+    # test that the set will fail after 'timeout'
+    euro.timeout.set(1)
+    with pytest.raises(FailedStatus):
         RE(mv(euro, 100))
+    # ensure callback is removed
+    assert len(euro.readback._callbacks['value']) == 0
+    euro.timeout.set(500)  # reset to default for the following tests.
 
-        # check that the readback value is within euro.tolerance of 100
-        assert abs(euro.readback.get() - 100) <= euro.tolerance.get()
-        assert len(euro.readback._callbacks['value']) == 0  # ensure cb is gone
+    # test that the lock prevents setting while set in progress
+    with pytest.raises(SetInProgress):
+        for i in range(2):  # The previous set may or may not be complete
+            euro.set(100)
 
-        # test that the set will fail after 'timeout'
-        euro.timeout.set(1)
-        with pytest.raises(FailedStatus):
-            RE(mv(euro, 100))
-        # ensure callback is removed
-        assert len(euro.readback._callbacks['value']) == 0
-        euro.timeout.set(500)  # reset to default for the following tests.
 
-        # test that the lock prevents setting while set in progress
-        with pytest.raises(SetInProgress):
-            for i in range(2):  # The previous set may or may not be complete
-                euro.set(100)
+class SoftEurotherm(Eurotherm):
+    '''A Eurotherm with soft readback and setpoint signals, needing no IOC.'''
+    setpoint = Cpt(Signal, value=0, kind='normal')
+    readback = Cpt(Signal, value=0, kind='hinted')
 
-    finally:
-        # Ensure that for any exception the ioc sub-process is terminated
-        # before raising.
-        ioc_process.terminate()
+
+@pytest.fixture
+def soft_euro():
+    euro = SoftEurotherm('', name='euro')
+    # `equilibrium_time` is kept well above the sleeps in the tests below, so
+    # that a slow test runner does not change their outcome
+    euro.equilibrium_time.put(1)
+    euro.tolerance.put(1)
+    euro.timeout.put(5)
+    return euro
+
+
+def test_Eurotherm_equilibrium(soft_euro):
+    '''Tests that a set only finishes after the readback stays in tolerance.'''
+    status = soft_euro.set(10)
+    assert soft_euro.setpoint.get() == 10
+
+    # enter the tolerance band, then leave it before `equilibrium_time`.
+    soft_euro.readback.put(10)
+    time.sleep(0.1)
+    soft_euro.readback.put(20)
+    # wait until after the first equilibrium timer would have fired.
+    time.sleep(1)
+    assert not status.done
+
+    # enter it again and stay there.
+    soft_euro.readback.put(10.5)
+    status.wait(5)
+    assert status.success
+    assert len(soft_euro.readback._callbacks['value']) == 0  # cb is gone
+
+    # the lock has been released, so a new set can start straight away.
+    status = soft_euro.set(10)
+    status.wait(5)
+    assert status.success
+
+
+def test_Eurotherm_timeout(soft_euro):
+    '''Tests that a set fails if the readback never reaches tolerance.'''
+    # the follow-up set made on failure uses the same values, so it must
+    # reach equilibrium before it times out
+    soft_euro.equilibrium_time.put(0.2)
+    soft_euro.timeout.put(1)
+    status = soft_euro.set(10)
+    soft_euro.readback.put(0)  # the first update starts the timeout timer
+
+    with pytest.raises(UnknownStatusFailure):
+        status.wait(5)
+    assert not status.success
+
+    # on failure ophyd stops the device, which sets it to the current value;
+    # wait for that set to reach equilibrium and release the lock.
+    assert soft_euro.setpoint.get() == 0
+    assert soft_euro._set_lock.acquire(timeout=5)
+    soft_euro._set_lock.release()
+    assert len(soft_euro.readback._callbacks['value']) == 0  # cb is gone
+
+    status = soft_euro.set(10)
+    soft_euro.readback.put(10)
+    status.wait(5)
+    assert status.success
+
+
+def test_Eurotherm_set_in_progress(soft_euro):
+    '''Tests that the lock prevents setting while a set is in progress.'''
+    status = soft_euro.set(10)
+    with pytest.raises(SetInProgress):
+        soft_euro.set(10)
+
+    # stop fails the set in progress and sets the current value.
+    soft_euro.stop()
+    assert status.done and not status.success
+    assert soft_euro.setpoint.get() == 0
@@ -5,16 +5,10 @@ import sys
 import pytest
 
 
-def test_conditional_import_negative_case():
-    """
-    Test that bluesky_kafka is not imported when publish_documents_with_kafka=False.
-
-    This is a "subprocess test" meaning the entire test function executes in a
-    separate python interpreter and the pass/fail result is returned by sys.exit().
-    This is necessary to guarantee bluesky_kakfa has not been imported as a result
-    of other tests.
-    """
-    the_test = """
+# the script takes one argument, "True" or "False", which is passed to
+# configure_base as publish_documents_with_kafka; it exits with status 0
+# if bluesky_kafka was imported exactly when it should have been
+the_test = """
 import sys
 from unittest.mock import Mock
 
@@ -23,6 +17,8 @@ import IPython.core.interactiveshell
 import nslsii
 
 
+publish_documents_with_kafka = sys.argv[1] == "True"
+
 ip = IPython.core.interactiveshell.InteractiveShell()
 nslsii.configure_base(
     user_ns=ip.user_ns,
@@ -36,22 +32,14 @@ nslsii.configure_base(
     pbar=False,
     ipython_logging=False,
     # this is the important condition for the test
-    publish_documents_with_kafka=False,
+    publish_documents_with_kafka=publish_documents_with_kafka,
 )
 
-if "bluesky_kafka" in sys.modules:
-    sys.exit(1)
+if ("bluesky_kafka" in sys.modules) == publish_documents_with_kafka:
+    sys.exit(0)
 else:
-    sys.exit(0)    
+    sys.exit(1)
 """
-    proc = subprocess.run(
-        [sys.executable, "-c", the_test],
-    )
-
-    if proc.returncode:
-        pytest.fail(
-            "The subprocess returned with non-zero exit status " f"{proc.returncode}."
-        )
 
 
 test_bluesky_kafka_config = """\
@@ -68,59 +56,35 @@ test_bluesky_kafka_config = """\
 """
 
 
-def test_conditional_import_positive_case(tmp_path):
+@pytest.mark.parametrize(
+    "publish_documents_with_kafka",
+    [False, True],
+    ids=["negative_case", "positive_case"],
+)
+def test_conditional_import(publish_documents_with_kafka, tmp_path):
     """
-    Test that bluesky_kafka is imported when publish_documents_with_kafka=True.
+    Test that bluesky_kafka is imported if and only if
+    publish_documents_with_kafka=True.
 
-    The connection to a Kafka broker will fail but that does not affect the test result.
+    In the positive case the connection to a Kafka broker will fail but that
+    does not affect the test result.
 
     This is a "subprocess test" meaning the entire test function executes in a
     separate python interpreter and the pass/fail result is returned by sys.exit().
     This is necessary to guarantee bluesky_kakfa has not been imported as a result
     of other tests.
     """
+    env = dict(os.environ)
+    if publish_documents_with_kafka:
+        # write a temporary file for this test
+        test_config_file_path = tmp_path / "bluesky_kafka_config_content.yml"
+        with open(test_config_file_path, "wt") as f:
+            f.write(test_bluesky_kafka_config)
+        env["BLUESKY_KAFKA_CONFIG_PATH"] = str(test_config_file_path)
 
-    # write a temporary file for this test
-    test_config_file_path = tmp_path / "bluesky_kafka_config_content.yml"
-    with open(test_config_file_path, "wt") as f:
-        f.write(test_bluesky_kafka_config)
-
-    the_test = f"""
-import sys
-from unittest.mock import Mock
-
-import IPython.core.interactiveshell
-
-import nslsii
-
-
-ip = IPython.core.interactiveshell.InteractiveShell()
-nslsii.configure_base(
-    user_ns=ip.user_ns,
-    # a mock databroker will be enough for this test
-    broker_name=Mock(),
-    bec=False,
-    epics_context=False,
-    magics=False,
-    mpl=False,
-    configure_logging=False,
-    pbar=False,
-    ipython_logging=False,
-    # this is the important condition for the test
-    publish_documents_with_kafka=True,
-)
-
-if "bluesky_kafka" in sys.modules:
-    sys.exit(0)
-else:
-    sys.exit(1)    
-"""
     proc = subprocess.run(
-        [sys.executable, "-c", the_test],
-        env={
-            **os.environ,
-            "BLUESKY_KAFKA_CONFIG_PATH": str(test_config_file_path),
-        },
+        [sys.executable, "-c", the_test, str(publish_documents_with_kafka)],
+        env=env,
     )
 
     if proc.returncode:
@@ -0,0 +1,194 @@
+import importlib
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+# nslsii.sync_experiment re-exports a function named sync_experiment,
+# which hides the module of the same name
+sync_experiment = importlib.import_module("nslsii.sync_experiment.sync_experiment")
+
+CURRENT_CYCLE = "2026-3"
+
+API_RESPONSES = {
+    "/v1/facility/nsls2/cycles/current": {"cycle": CURRENT_CYCLE},
+    "/v1/proposals/commissioning?beamline=chx": {
+        "commissioning_proposals": ["999999"]
+    },
+    "/v1/proposal/123456": {
+        "proposal": {"cycles": [CURRENT_CYCLE], "instruments": ["CHX"]}
+    },
+    "/v1/proposal/234567": {
+        "proposal": {"cycles": ["2020-1"], "instruments": ["CHX"]}
+    },
+    "/v1/proposal/999999": {
+        "proposal": {"cycles": ["2020-1"], "instruments": ["CHX"]}
+    },
+    "/v1/data-session/someone": {
+        "facility_all_access": [],
+        "beamline_all_access": [],
+        "data_sessions": [],
+    },
+}
+
+
+class FakeAPIClient:
+    """
+    Stands in for the shared httpx.Client, answering from API_RESPONSES
+    and recording the requested URLs.
+    """
+
+    def __init__(self):
+        self.requests = []
+
+    def get(self, url):
+        self.requests.append(url)
+        return httpx.Response(
+            200,
+            json=API_RESPONSES[url],
+            request=httpx.Request("GET", f"https://api.nsls2.bnl.gov{url}"),
+        )
+
+
+@pytest.fixture
+def api_client(monkeypatch):
+    """
+    Replace the NSLS-II API client with a FakeAPIClient so that no
+    network requests are made, and start and finish with empty caches.
+    """
+    client = FakeAPIClient()
+    monkeypatch.setattr(sync_experiment, "_api_client", lambda: client)
+    sync_experiment.clear_cycle_cache()
+    sync_experiment._get_user_access.cache_clear()
+    yield client
+    sync_experiment.clear_cycle_cache()
+    sync_experiment._get_user_access.cache_clear()
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """
+    Replace time.monotonic in sync_experiment with a clock that
+    only moves when the test advances it.
+    """
+    clock = SimpleNamespace(now=1000.0)
+    monkeypatch.setattr(
+        sync_experiment, "time", SimpleNamespace(monotonic=lambda: clock.now)
+    )
+    return clock
+
+
+def test_api_client_builds():
+    # build the real client, not the cached one, with or without h2 installed
+    client = sync_experiment._api_client.__wrapped__()
+    try:
+        assert isinstance(client, httpx.Client)
+        assert client.base_url == "https://api.nsls2.bnl.gov"
+    finally:
+        client.close()
+
+
+def test_ttl_cache_expiry(clock):
+    calls = []
+
+    @sync_experiment._ttl_cache(10)
+    def double(x):
+        calls.append(x)
+        return 2 * x
+
+    assert double(1) == 2
+    assert double(1) == 2
+    assert double(2) == 4
+    assert calls == [1, 2]
+
+    clock.now += 9.9
+    assert double(1) == 2
+    assert calls == [1, 2]
+
+    clock.now += 0.1
+    assert double(1) == 2
+    assert calls == [1, 2, 1]
+
+    double.cache_clear()
+    assert double(2) == 4
+    assert calls == [1, 2, 1, 2]
+
+
+def test_ttl_cache_maxsize(clock):
+    calls = []
+
+    @sync_experiment._ttl_cache(10, maxsize=2)
+    def double(x):
+        calls.append(x)
+        return 2 * x
+
+    double(1)
+    double(2)
+    double(1)  # 2 is now the least recently used
+    double(3)
+    assert calls == [1, 2, 3]
+
+    double(1)
+    double(2)
+    assert calls == [1, 2, 3, 2]
+
+
+def test_clear_cycle_cache(api_client, clock):
+    cycle_url = "/v1/facility/nsls2/cycles/current"
+    commissioning_url = "/v1/proposals/commissioning?beamline=chx"
+
+    assert sync_experiment.get_current_cycle() == CURRENT_CYCLE
+    assert sync_experiment.is_commissioning_proposal("999999", "chx")
+    assert not sync_experiment.is_commissioning_proposal("123456", "chx")
+    assert api_client.requests == [cycle_url, commissioning_url]
+
+    sync_experiment.clear_cycle_cache()
+    sync_experiment.get_current_cycle()
+    sync_experiment.is_commissioning_proposal("999999", "chx")
+    assert api_client.requests == [cycle_url, commissioning_url] * 2
+
+    clock.now += sync_experiment.API_CACHE_TTL
+    sync_experiment.get_current_cycle()
+    assert api_client.requests == [cycle_url, commissioning_url] * 2 + [cycle_url]
+
+
+def test_user_access_denial_expires(api_client, clock):
+    user_url = "/v1/data-session/someone"
+
+    assert not sync_experiment.should_they_be_here("someone", "pass-123456", "chx")
+    assert not sync_experiment.should_they_be_here("someone", "pass-123456", "chx")
+    assert api_client.requests == [user_url]
+
+    clock.now += 60
+    assert not sync_experiment.should_they_be_here("someone", "pass-123456", "chx")
+    assert api_client.requests == [user_url] * 2
+
+
+@pytest.mark.parametrize(
+    "data_session",
+    ["pass-", "pass-12a", "pass-123\n", "pass--1", " pass-1", "123456", "Pass-1"],
+)
+def test_validate_proposal_rejects_data_session(api_client, data_session):
+    with pytest.raises(ValueError, match="is not matched by regular expression"):
+        sync_experiment.validate_proposal(data_session, "chx")
+    assert api_client.requests == []
+    assert sync_experiment.data_session_re.match(data_session) is None
+
+
+def test_validate_proposal_accepts_data_session(api_client):
+    proposal_data = sync_experiment.validate_proposal("pass-123456", "chx")
+    assert proposal_data == API_RESPONSES["/v1/proposal/123456"]["proposal"]
+    assert "/v1/proposal/123456" in api_client.requests
+    assert sync_experiment.data_session_re.match("pass-123456")
+
+
+def test_validate_proposal_not_in_current_cycle(api_client):
+    with pytest.raises(ValueError, match="not valid in the current NSLS2 cycle"):
+        sync_experiment.validate_proposal("pass-234567", "chx")
+
+
+def test_validate_proposal_commissioning_skips_cycle_check(api_client):
+    # proposal 999999 is not in the current cycle, but is a commissioning
+    # proposal, so the current cycle is not checked
+    proposal_data = sync_experiment.validate_proposal("pass-999999", "chx")
+    assert proposal_data == API_RESPONSES["/v1/proposal/999999"]["proposal"]